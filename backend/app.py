@@ -5,39 +5,91 @@ A secure Flask backend for video streaming with MongoDB.
 Features: JWT auth, rate limiting, YouTube video wrapper, logging
 """
 
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, jsonify, Response, g
 from flask_pymongo import PyMongo
+from pymongo import WriteConcern
 from flask_jwt_extended import (
     JWTManager, create_access_token, create_refresh_token,
     jwt_required, get_jwt_identity, get_jwt, set_access_cookies,
     set_refresh_cookies, unset_jwt_cookies
 )
 from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
 from datetime import datetime, timedelta, timezone
-import bcrypt
 import os
 import logging
+import logging.handlers
 import uuid
 import secrets
 import hashlib
+import hmac
+import json
+import queue
+import random
+import threading
+import time
+import atexit
+import multiprocessing
 from functools import wraps
+from typing import Union
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dotenv import load_dotenv
-import yt_dlp
 import requests
+import redis
+import orjson
+from cachetools import TTLCache
 from cryptography.fernet import Fernet
+import password_hashing
 
 # Load environment variables
 load_dotenv()
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any fields passed via `extra`"""
+    
+    _RESERVED = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+    
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'logger': record.name,
+            'level': record.levelname,
+            'message': record.getMessage()
+        }
+        entry.update((k, v) for k, v in vars(record).items() if k not in self._RESERVED)
+        return json.dumps(entry, default=str)
+
+
+# Handlers run on a background listener thread; request threads only enqueue
+# File logging is opt-in; serverless hosts (Vercel) have a read-only filesystem
+_log_handlers = [logging.StreamHandler()]
+_log_file_error = None
+if os.getenv('LOG_FILE'):
+    try:
+        _log_handlers.append(logging.FileHandler(os.getenv('LOG_FILE')))
+    except OSError as e:
+        _log_file_error = e
+for _handler in _log_handlers:
+    _handler.setFormatter(JsonFormatter())
+
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Fraction of requests whose request/response lines are logged
+LOG_SAMPLE_RATE = float(os.getenv('LOG_SAMPLE_RATE', 0.1))
 
 logger = logging.getLogger(__name__)
+if _log_file_error:
+    logger.warning(f"File logging disabled: {_log_file_error}")
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -50,13 +102,45 @@ app.config['JWT_REFRESH_TOKEN_EXPIRES'] = timedelta(days=7)
 app.config['JWT_TOKEN_LOCATION'] = ['headers']
 app.config['JWT_HEADER_NAME'] = 'Authorization'
 app.config['JWT_HEADER_TYPE'] = 'Bearer'
+# Ed25519 keys (PEM) switch JWTs to EdDSA with separate sign/verify keys;
+# otherwise HS256 with JWT_SECRET_KEY, run through OpenSSL's C HMAC.
+if os.getenv('JWT_PRIVATE_KEY') and os.getenv('JWT_PUBLIC_KEY'):
+    app.config['JWT_ALGORITHM'] = 'EdDSA'
+    app.config['JWT_PRIVATE_KEY'] = os.getenv('JWT_PRIVATE_KEY').replace('\\n', '\n')
+    app.config['JWT_PUBLIC_KEY'] = os.getenv('JWT_PUBLIC_KEY').replace('\\n', '\n')
 app.config['MONGO_URI'] = os.getenv('MONGO_URI', 'mongodb://localhost:27017/videoapp')
 app.config['ENCRYPTION_KEY'] = os.getenv('ENCRYPTION_KEY', Fernet.generate_key().decode())
+app.config['REDIS_URL'] = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+app.config['BCRYPT_ROUNDS'] = int(os.getenv('BCRYPT_ROUNDS', 12))
+app.config['BCRYPT_MAX_PENDING'] = int(os.getenv('BCRYPT_MAX_PENDING', 500))
+# Deprecated skip-based ?page= pagination on the dashboard (use ?after= instead)
+app.config['DASHBOARD_LEGACY_PAGINATION'] = os.getenv('DASHBOARD_LEGACY_PAGINATION', 'true').lower() == 'true'
+app.config['RATELIMIT_EXEMPT_DASHBOARD'] = os.getenv('RATELIMIT_EXEMPT_DASHBOARD', 'false').lower() == 'true'
+# Number of reverse proxies in front of the app whose X-Forwarded-For hops are
+# trusted (e.g. 1 behind Heroku/nginx, 2 behind CDN + load balancer). Keep 0
+# when clients connect directly, otherwise they can spoof their address.
+app.config['TRUSTED_PROXY_COUNT'] = int(os.getenv('TRUSTED_PROXY_COUNT', 0))
+
+if app.config['TRUSTED_PROXY_COUNT']:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['TRUSTED_PROXY_COUNT'])
 
 # Initialize extensions
-mongo = PyMongo(app)
+# _id fields are BSON Binary UUIDs (subtype 4); strings only at the JSON boundary
+mongo = PyMongo(app, uuidRepresentation='standard')
 jwt = JWTManager(app)
+redis_pool = redis.ConnectionPool.from_url(
+    app.config['REDIS_URL'],
+    max_connections=50,
+    decode_responses=True
+)
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+# Static keys are encoded once at startup rather than on every call
+_SECRET_BYTES = app.config['SECRET_KEY'].encode()
 cipher_suite = Fernet(app.config['ENCRYPTION_KEY'].encode())
+# BLAKE2b keys are limited to 64 bytes, so derive a fixed-size one
+_PLAYBACK_KEY = hashlib.sha256(_SECRET_BYTES).digest()
+PLAYBACK_TOKEN_TTL = 2 * 60 * 60  # 2 hours
 
 # CORS configuration
 CORS(app, resources={
@@ -68,11 +152,25 @@ CORS(app, resources={
 })
 
 # Rate limiter configuration
+
+def get_client_address() -> str:
+    """Client address, resolved once per request and cached on g"""
+    if 'remote_addr' not in g:
+        # ProxyFix has already resolved trusted X-Forwarded-For hops
+        g.remote_addr = request.remote_addr or '127.0.0.1'
+    return g.remote_addr
+
+
 limiter = Limiter(
     app=app,
-    key_func=get_remote_address,
+    key_func=get_client_address,
     default_limits=["200 per day", "50 per hour"],
-    storage_uri=os.getenv('REDIS_URL', 'memory://')
+    # Shared across workers/instances; fixed-window is O(1) per check in Redis
+    storage_uri=app.config['REDIS_URL'],
+    strategy='fixed-window',
+    # A Redis outage falls back to per-process counters instead of failing requests
+    in_memory_fallback_enabled=True,
+    swallow_errors=True
 )
 
 # ============== DATABASE MODELS ==============
@@ -83,30 +181,282 @@ def get_user_collection():
 def get_video_collection():
     return mongo.db.videos
 
-def get_token_collection():
-    return mongo.db.tokens
+def parse_uuid(value: str):
+    """UUID from a client-supplied id, or None if it is not a valid UUID"""
+    try:
+        return uuid.UUID(value)
+    except (TypeError, ValueError):
+        return None
 
 def get_watch_history_collection():
-    return mongo.db.watch_history
+    # Watch events are not business-critical, so writes are fire-and-forget
+    return mongo.db.get_collection(
+        'watch_history',
+        write_concern=WriteConcern(w=0, j=False)
+    )
+
+# ============== USER PROFILE CACHE ==============
+
+# Cached fields (id, name, email, created_at) are never updated by any
+# endpoint, so entries only expire; add invalidation alongside any future
+# profile edit.
+USER_CACHE_TTL = 60  # seconds
+
+
+def _user_cache_key(user_id: str) -> str:
+    return f"user:{user_id}"
+
+
+def get_user_cached(user_id: str):
+    """Public profile for a user, served from Redis when possible"""
+    key = _user_cache_key(user_id)
+    try:
+        cached = redis_client.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+    except redis.RedisError as e:
+        logger.warning(f"User cache read failed: {e}")
+    
+    user_uuid = parse_uuid(user_id)
+    if user_uuid is None:
+        return None
+    
+    user = get_user_collection().find_one(
+        {'_id': user_uuid},
+        projection={'name': 1, 'email': 1, 'created_at': 1}
+    )
+    if not user:
+        return None
+    
+    profile = {
+        'id': str(user['_id']),
+        'name': user['name'],
+        'email': user['email'],
+        'created_at': user.get('created_at')
+    }
+    try:
+        # Same encoding as ojson(), so cache hits and misses render identically
+        redis_client.setex(key, USER_CACHE_TTL, orjson.dumps(profile, option=ORJSON_OPTIONS))
+    except redis.RedisError as e:
+        logger.warning(f"User cache write failed: {e}")
+    return profile
+
+# ============== WATCH HISTORY WRITER ==============
+
+# Watch events are queued and written in batches by a background thread so
+# the insert never sits on the request path.
+WATCH_BATCH_SIZE = 100
+WATCH_FLUSH_INTERVAL = 0.5  # seconds
+_watch_queue = queue.Queue(maxsize=10000)
+
+
+def record_watch_event(record: dict):
+    """Queue a watch history document for the background writer"""
+    try:
+        _watch_queue.put_nowait(record)
+    except queue.Full:
+        logger.warning(f"Watch history queue full, dropping event for video {record.get('video_id')}")
+
+
+def _drain_watch_queue():
+    while True:
+        batch = [_watch_queue.get()]
+        deadline = time.monotonic() + WATCH_FLUSH_INTERVAL
+        while len(batch) < WATCH_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_watch_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            get_watch_history_collection().insert_many(batch, ordered=False)
+        except Exception as e:
+            logger.warning(f"Failed to write {len(batch)} watch events: {e}")
+
+
+threading.Thread(target=_drain_watch_queue, name='watch-history-writer', daemon=True).start()
 
 # ============== JWT TOKEN BLACKLIST ==============
 
+# Revoked jtis live in Redis as auth:revoked:{jti} and expire together with
+# the token. A short-lived in-process cache of lookups (both revoked and
+# not-revoked results) lets most authenticated requests skip Redis entirely.
+REVOKED_KEY_PREFIX = 'auth:revoked:'
+REVOKED_CHANNEL = 'token:revoked'
+_revoked_cache = TTLCache(maxsize=10000, ttl=30)
+_revoked_cache_lock = threading.Lock()
+
+
+def mark_token_revoked(jti: str):
+    """Record a revoked jti in the local cache"""
+    with _revoked_cache_lock:
+        _revoked_cache[jti] = True
+
+
+def _handle_revoked_message(message):
+    data = message.get('data')
+    if isinstance(data, str):
+        mark_token_revoked(data)
+
+
+class RevocationCheckUnavailable(Exception):
+    """Raised when the token blacklist cannot be reached"""
+
+
+REVOCATION_LISTENER_RETRY = 30  # seconds between subscription attempts
+_revocation_listener = None
+_revocation_listener_healthy = False
+_revocation_listener_next_attempt = 0.0
+_revocation_listener_lock = threading.Lock()
+
+
+def _on_revocation_listener_error(exc, pubsub, thread):
+    """Keep the listener thread alive across Redis disconnects"""
+    global _revocation_listener_healthy
+    _revocation_listener_healthy = False
+    # Revocations published while disconnected were missed
+    with _revoked_cache_lock:
+        _revoked_cache.clear()
+    logger.warning(f"Token revocation listener disconnected, reconnecting: {exc}")
+    while True:
+        time.sleep(1)
+        try:
+            # Reconnecting re-subscribes to the channel via the on_connect callback
+            pubsub.ping()
+        except redis.RedisError:
+            continue
+        _revocation_listener_healthy = True
+        logger.info("Token revocation listener reconnected")
+        return
+
+
+def start_revocation_listener():
+    """Subscribe to revocations published by other instances (retried lazily)"""
+    global _revocation_listener, _revocation_listener_healthy, _revocation_listener_next_attempt
+    if _revocation_listener is not None or time.monotonic() < _revocation_listener_next_attempt:
+        return
+    with _revocation_listener_lock:
+        if _revocation_listener is not None or time.monotonic() < _revocation_listener_next_attempt:
+            return
+        _revocation_listener_next_attempt = time.monotonic() + REVOCATION_LISTENER_RETRY
+        try:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{REVOKED_CHANNEL: _handle_revoked_message})
+            _revocation_listener = pubsub.run_in_thread(
+                sleep_time=1,
+                daemon=True,
+                exception_handler=_on_revocation_listener_error
+            )
+            _revocation_listener_healthy = True
+        except redis.RedisError as e:
+            logger.warning(f"Token revocation listener unavailable: {e}")
+
+
+start_revocation_listener()
+
+
 @jwt.token_in_blocklist_loader
 def check_if_token_revoked(jwt_header, jwt_payload):
     jti = jwt_payload['jti']
-    token = get_token_collection().find_one({'jti': jti})
-    return token is not None
+    start_revocation_listener()
+    with _revoked_cache_lock:
+        revoked = _revoked_cache.get(jti)
+    # Cached "not revoked" results are only safe while we hear other instances' logouts
+    if revoked or (revoked is False and _revocation_listener_healthy):
+        return revoked
+    
+    try:
+        revoked = redis_client.exists(f"{REVOKED_KEY_PREFIX}{jti}") == 1
+    except redis.RedisError as e:
+        # Fail closed: without the blacklist we cannot tell if the token was revoked
+        logger.error(f"Token revocation check failed: {e}")
+        raise RevocationCheckUnavailable() from e
+    with _revoked_cache_lock:
+        _revoked_cache[jti] = revoked
+    return revoked
 
 # ============== AUTHENTICATION UTILS ==============
 
+# bcrypt is CPU-bound, so it runs in a process pool instead of the request
+# thread. Pending jobs are capped; beyond that requests are turned away.
+# The pool is created on first use from a fresh forkserver/spawn process
+# (never forked from this multi-threaded one); where that is impossible
+# (no /dev/shm on serverless, or the dev server running app.py as __main__,
+# which workers would re-execute) bcrypt runs inline.
+_bcrypt_pool = None
+_bcrypt_pool_disabled = False
+_bcrypt_pool_lock = threading.Lock()
+_bcrypt_slots = threading.BoundedSemaphore(app.config['BCRYPT_MAX_PENDING'])
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many bcrypt jobs are already queued"""
+
+
+def _get_bcrypt_pool():
+    global _bcrypt_pool, _bcrypt_pool_disabled
+    if _bcrypt_pool_disabled or _bcrypt_pool is not None:
+        return None if _bcrypt_pool_disabled else _bcrypt_pool
+    with _bcrypt_pool_lock:
+        if _bcrypt_pool_disabled or _bcrypt_pool is not None:
+            return None if _bcrypt_pool_disabled else _bcrypt_pool
+        if __name__ == '__main__':
+            _bcrypt_pool_disabled = True
+            return None
+        try:
+            methods = multiprocessing.get_all_start_methods()
+            ctx = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            if ctx.get_start_method() == 'forkserver':
+                ctx.set_forkserver_preload(['password_hashing'])
+            _bcrypt_pool = ProcessPoolExecutor(
+                max_workers=(os.cpu_count() or 1) * 2,
+                mp_context=ctx
+            )
+        except (OSError, ImportError, NotImplementedError, ValueError) as e:
+            logger.warning(f"bcrypt process pool unavailable, hashing inline: {e}")
+            _bcrypt_pool_disabled = True
+    return _bcrypt_pool
+
+def _run_bcrypt(fn, *args):
+    global _bcrypt_pool_disabled
+    if not _bcrypt_slots.acquire(blocking=False):
+        raise PasswordHasherBusy()
+    try:
+        pool = _get_bcrypt_pool()
+        if pool is not None:
+            try:
+                return pool.submit(fn, *args).result()
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"bcrypt process pool failed, hashing inline: {e}")
+                _bcrypt_pool_disabled = True
+        return fn(*args)
+    finally:
+        _bcrypt_slots.release()
+
 def hash_password(password: str) -> str:
     """Hash password using bcrypt"""
-    salt = bcrypt.gensalt(rounds=12)
-    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+    return _run_bcrypt(password_hashing.hash_password, password, app.config['BCRYPT_ROUNDS'])
 
 def verify_password(password: str, hashed: str) -> bool:
     """Verify password against hash"""
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    return _run_bcrypt(password_hashing.check_password, password, hashed)
+
+# Mongo returns naive UTC datetimes; render every timestamp as UTC with "Z"
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+def ojson(obj, status: int = 200) -> Response:
+    """JSON response serialized with orjson (datetimes are emitted as UTC "Z")"""
+    return Response(
+        orjson.dumps(obj, option=ORJSON_OPTIONS),
+        status=status,
+        mimetype='application/json'
+    )
+
+def busy_response():
+    """Backpressure response when the password hasher is saturated"""
+    return jsonify({'error': 'Server busy, please retry'}), 503, {'Retry-After': '1'}
 
 def generate_tokens(user_id: str) -> dict:
     """Generate access and refresh tokens"""
@@ -119,46 +469,88 @@ def generate_tokens(user_id: str) -> dict:
         'expires_in': 900  # 15 minutes
     }
 
-def encrypt_youtube_id(youtube_id: str) -> str:
+def encrypt_youtube_id(youtube_id: Union[str, bytes]) -> str:
     """Encrypt YouTube ID for secure transmission"""
-    return cipher_suite.encrypt(youtube_id.encode()).decode()
+    if isinstance(youtube_id, str):
+        youtube_id = youtube_id.encode()
+    return cipher_suite.encrypt(youtube_id).decode()
 
-def decrypt_youtube_id(encrypted_id: str) -> str:
+def decrypt_youtube_id(encrypted_id: Union[str, bytes]) -> str:
     """Decrypt YouTube ID"""
-    return cipher_suite.decrypt(encrypted_id.encode()).decode()
+    if isinstance(encrypted_id, str):
+        encrypted_id = encrypted_id.encode()
+    return cipher_suite.decrypt(encrypted_id).decode()
+
+def playback_signer(user_id: str, exp: int):
+    """Keyed BLAKE2b hasher pre-seeded with the per-user part of a token"""
+    signer = hashlib.blake2b(key=_PLAYBACK_KEY, digest_size=32)
+    signer.update(f"{exp}:{user_id}:".encode())
+    return signer
+
+def _sign_playback(signer, video_id: str) -> str:
+    h = signer.copy()
+    h.update(video_id.encode())
+    return h.hexdigest()
+
+def generate_playback_tokens(video_ids: list, user_id: str) -> list:
+    """Generate signed playback tokens ("<exp>.<signature>") for several videos"""
+    exp = int(time.time()) + PLAYBACK_TOKEN_TTL
+    signer = playback_signer(user_id, exp)
+    return [f"{exp}.{_sign_playback(signer, video_id)}" for video_id in video_ids]
 
 def generate_playback_token(video_id: str, user_id: str) -> str:
     """Generate signed playback token"""
-    timestamp = datetime.now(timezone.utc).isoformat()
-    data = f"{video_id}:{user_id}:{timestamp}:{app.config['SECRET_KEY']}"
-    return hashlib.sha256(data.encode()).hexdigest()
+    return generate_playback_tokens([video_id], user_id)[0]
 
 def verify_playback_token(video_id: str, user_id: str, token: str) -> bool:
-    """Verify playback token validity"""
-    # Token valid for 2 hours
-    for hour_offset in range(3):
-        timestamp = (datetime.now(timezone.utc) - timedelta(hours=hour_offset)).isoformat()
-        data = f"{video_id}:{user_id}:{timestamp}:{app.config['SECRET_KEY']}"
-        expected = hashlib.sha256(data.encode()).hexdigest()
-        if secrets.compare_digest(token, expected):
-            return True
-    return False
+    """Verify playback token signature and expiry"""
+    exp, _, signature = token.partition('.')
+    if not exp.isdecimal() or int(exp) < time.time():
+        return False
+    if not signature.isascii():
+        return False
+    expected = _sign_playback(playback_signer(user_id, int(exp)), video_id)
+    return hmac.compare_digest(signature, expected)
 
 # ============== REQUEST LOGGING MIDDLEWARE ==============
 
+@app.before_request
+def stamp_request_time():
+    """Read the clock once per request; handlers use g.now_utc"""
+    g.now_utc = datetime.now(timezone.utc)
+
 @app.before_request
 def log_request():
-    """Log all incoming requests"""
-    logger.info(f"Request: {request.method} {request.path} - IP: {get_remote_address()}")
+    """Log a sample of incoming requests"""
+    g.log_sampled = random.random() < LOG_SAMPLE_RATE
+    if g.log_sampled:
+        logger.info('request', extra={
+            'method': request.method,
+            'path': request.path,
+            'ip': get_client_address()
+        })
 
 @app.after_request
 def log_response(response):
-    """Log response status"""
-    logger.info(f"Response: {response.status_code} for {request.method} {request.path}")
+    """Log response status for sampled requests"""
+    if g.get('log_sampled'):
+        logger.info('response', extra={
+            'status': response.status_code,
+            'method': request.method,
+            'path': request.path
+        })
     return response
 
 # ============== AUTHENTICATION ENDPOINTS ==============
 
+LOGIN_PROJECTION = {
+    '_id': 1,
+    'name': 1,
+    'email': 1,
+    'password_hash': 1,
+    'is_active': 1
+}
+
 @app.route('/', methods=['GET'])
 def root():
     return jsonify({
@@ -188,38 +580,41 @@ def signup():
         if len(password) < 6:
             return jsonify({'error': 'Password must be at least 6 characters'}), 400
         
-        # Check if user exists
-        if get_user_collection().find_one({'email': email}):
+        # Check if user exists (covered by the unique email index)
+        if get_user_collection().find_one({'email': email}, projection={'_id': 0, 'email': 1}):
             return jsonify({'error': 'Email already registered'}), 409
         
         # Create user
         user = {
-            '_id': str(uuid.uuid4()),
+            '_id': uuid.uuid4(),
             'name': name,
             'email': email,
             'password_hash': hash_password(password),
-            'created_at': datetime.now(timezone.utc),
-            'updated_at': datetime.now(timezone.utc),
+            'created_at': g.now_utc,
+            'updated_at': g.now_utc,
             'is_active': True
         }
         
         get_user_collection().insert_one(user)
         
         # Generate tokens
-        tokens = generate_tokens(user['_id'])
+        tokens = generate_tokens(str(user['_id']))
         
         logger.info(f"User registered: {email}")
         
         return jsonify({
             'message': 'User registered successfully',
             'user': {
-                'id': user['_id'],
+                'id': str(user['_id']),
                 'name': user['name'],
                 'email': user['email']
             },
             'tokens': tokens
         }), 201
         
+    except PasswordHasherBusy:
+        logger.warning("Signup rejected: password hasher busy")
+        return busy_response()
     except Exception as e:
         logger.error(f"Signup error: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
@@ -242,7 +637,7 @@ def login():
             return jsonify({'error': 'Email and password are required'}), 400
         
         # Find user
-        user = get_user_collection().find_one({'email': email})
+        user = get_user_collection().find_one({'email': email}, projection=LOGIN_PROJECTION)
         
         if not user or not verify_password(password, user['password_hash']):
             logger.warning(f"Failed login attempt for: {email}")
@@ -252,12 +647,12 @@ def login():
             return jsonify({'error': 'Account is deactivated'}), 403
         
         # Generate tokens
-        tokens = generate_tokens(user['_id'])
+        tokens = generate_tokens(str(user['_id']))
         
         # Update last login
         get_user_collection().update_one(
             {'_id': user['_id']},
-            {'$set': {'last_login': datetime.now(timezone.utc)}}
+            {'$set': {'last_login': g.now_utc}}
         )
         
         logger.info(f"User logged in: {email}")
@@ -265,13 +660,16 @@ def login():
         return jsonify({
             'message': 'Login successful',
             'user': {
-                'id': user['_id'],
+                'id': str(user['_id']),
                 'name': user['name'],
                 'email': user['email']
             },
             'tokens': tokens
         }), 200
         
+    except PasswordHasherBusy:
+        logger.warning("Login rejected: password hasher busy")
+        return busy_response()
     except Exception as e:
         logger.error(f"Login error: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
@@ -285,8 +683,7 @@ def refresh():
         user_id = get_jwt_identity()
         
         # Verify user still exists
-        user = get_user_collection().find_one({'_id': user_id})
-        if not user:
+        if not get_user_cached(user_id):
             return jsonify({'error': 'User not found'}), 404
         
         # Create new access token
@@ -310,18 +707,12 @@ def refresh():
 def get_current_user():
     """Get current user profile"""
     try:
-        user_id = get_jwt_identity()
-        user = get_user_collection().find_one({'_id': user_id})
+        user = get_user_cached(get_jwt_identity())
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
         
-        return jsonify({
-            'id': user['_id'],
-            'name': user['name'],
-            'email': user['email'],
-            'created_at': user['created_at'].isoformat() if user.get('created_at') else None
-        }), 200
+        return ojson(user)
         
     except Exception as e:
         logger.error(f"Get user error: {str(e)}")
@@ -333,15 +724,20 @@ def get_current_user():
 def logout():
     """Logout user and revoke token"""
     try:
-        jti = get_jwt()['jti']
+        claims = get_jwt()
+        jti = claims['jti']
         user_id = get_jwt_identity()
         
-        # Add token to blacklist
-        get_token_collection().insert_one({
-            'jti': jti,
-            'user_id': user_id,
-            'revoked_at': datetime.now(timezone.utc)
-        })
+        # Add token to blacklist until it would have expired anyway
+        ttl = max(1, claims['exp'] - int(time.time()))
+        redis_client.set(f"{REVOKED_KEY_PREFIX}{jti}", '1', ex=ttl)
+        mark_token_revoked(jti)
+        
+        # Let other instances drop their cached "not revoked" entry
+        try:
+            redis_client.publish(REVOKED_CHANNEL, jti)
+        except redis.RedisError as pub_err:
+            logger.warning(f"Failed to publish token revocation: {pub_err}")
         
         logger.info(f"User logged out: {user_id}")
         
@@ -354,6 +750,30 @@ def logout():
 
 # ============== VIDEO ENDPOINTS ==============
 
+DASHBOARD_PROJECTION = {
+    '_id': 1,
+    'title': 1,
+    'description': 1,
+    'thumbnail_url': 1,
+    'created_at': 1
+}
+
+# Exact active-video count, refreshed at most once a minute
+_active_count_cache = TTLCache(maxsize=1, ttl=60)
+_active_count_lock = threading.Lock()
+
+
+def count_active_videos() -> int:
+    """Number of active videos, cached briefly to avoid a count per request"""
+    with _active_count_lock:
+        total = _active_count_cache.get('active')
+    if total is None:
+        total = get_video_collection().count_documents({'is_active': True})
+        with _active_count_lock:
+            _active_count_cache['active'] = total
+    return total
+
+
 @app.route('/api/dashboard', methods=['GET'])
 @jwt_required()
 def get_dashboard():
@@ -361,47 +781,74 @@ def get_dashboard():
     try:
         user_id = get_jwt_identity()
         
-        # Get page parameter for pagination (bonus feature)
+        # Keyset pagination: ?after=<last id of previous page>
+        after = request.args.get('after')
         page = int(request.args.get('page', 1))
         per_page = int(request.args.get('per_page', 2))
+        legacy_paging = not after and 'page' in request.args
+        if legacy_paging and not app.config['DASHBOARD_LEGACY_PAGINATION']:
+            return jsonify({'error': 'page is no longer supported, use after=<next_cursor>'}), 400
         
-        # Fetch active videos with pagination
-        videos = list(get_video_collection().find(
-            {'is_active': True}
-        ).skip((page - 1) * per_page).limit(per_page))
+        query = {'is_active': True}
+        if after:
+            after_id = parse_uuid(after)
+            if after_id is None:
+                return jsonify({'error': 'Invalid cursor'}), 400
+            query['_id'] = {'$gt': after_id}
+        
+        cursor = get_video_collection().find(
+            query,
+            projection=DASHBOARD_PROJECTION
+        ).sort('_id', 1)
+        if legacy_paging:
+            cursor = cursor.skip((page - 1) * per_page)
+        else:
+            page = None if after else 1
+        videos = list(cursor.limit(per_page))
         
         # Get total count for pagination info
-        total = get_video_collection().count_documents({'is_active': True})
+        total = count_active_videos()
+        
+        # Generate secure playback tokens for the whole page at once
+        video_ids = [str(video['_id']) for video in videos]
+        playback_tokens = generate_playback_tokens(video_ids, user_id)
         
         result = []
-        for video in videos:
-            # Generate secure playback token
-            playback_token = generate_playback_token(str(video['_id']), user_id)
-            
+        for video, video_id, playback_token in zip(videos, video_ids, playback_tokens):
             result.append({
-                'id': str(video['_id']),
+                'id': video_id,
                 'title': video['title'],
                 'description': video['description'],
                 'thumbnail_url': video['thumbnail_url'],
                 'playback_token': playback_token,
-                'created_at': video.get('created_at', datetime.now(timezone.utc)).isoformat()
+                'created_at': video.get('created_at') or g.now_utc
             })
         
-        return jsonify({
+        next_cursor = video_ids[-1] if len(videos) == per_page else None
+        
+        response = ojson({
             'videos': result,
             'pagination': {
                 'page': page,
                 'per_page': per_page,
                 'total': total,
-                'total_pages': (total + per_page - 1) // per_page
+                'total_pages': (total + per_page - 1) // per_page,
+                'next_cursor': next_cursor
             }
-        }), 200
+        })
+        if legacy_paging:
+            response.headers['Deprecation'] = 'true'
+        return response
         
     except Exception as e:
         logger.error(f"Dashboard error: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
 
+if app.config['RATELIMIT_EXEMPT_DASHBOARD']:
+    limiter.exempt(get_dashboard)
+
+
 @app.route('/api/video/<video_id>/stream', methods=['GET'])
 @jwt_required()
 def get_video_stream(video_id):
@@ -415,7 +862,8 @@ def get_video_stream(video_id):
             return jsonify({'error': 'Invalid or expired token'}), 403
         
         # Get video from database
-        video = get_video_collection().find_one({'_id': video_id})
+        video_uuid = parse_uuid(video_id)
+        video = video_uuid and get_video_collection().find_one({'_id': video_uuid})
         if not video:
             return jsonify({'error': 'Video not found'}), 404
         
@@ -440,18 +888,15 @@ def get_video_stream(video_id):
             }
         }
         
-        # Log watch event (async-like, don't wait)
-        try:
-            get_watch_history_collection().insert_one({
-                'user_id': user_id,
-                'video_id': video_id,
-                'watched_at': datetime.now(timezone.utc),
-                'action': 'stream_requested'
-            })
-        except Exception as log_err:
-            logger.warning(f"Failed to log watch event: {log_err}")
+        # Log watch event (queued, written in the background)
+        record_watch_event({
+            'user_id': parse_uuid(user_id),
+            'video_id': video_uuid,
+            'watched_at': g.now_utc,
+            'action': 'stream_requested'
+        })
         
-        return jsonify(stream_data), 200
+        return ojson(stream_data)
         
     except Exception as e:
         logger.error(f"Stream error: {str(e)}")
@@ -466,30 +911,32 @@ def track_video_watch(video_id):
         user_id = get_jwt_identity()
         data = request.get_json() or {}
         
-        # Validate video exists
-        video = get_video_collection().find_one({'_id': video_id})
+        # Validate video exists (covered by the _id index)
+        video_uuid = parse_uuid(video_id)
+        user_uuid = parse_uuid(user_id)
+        video = video_uuid and get_video_collection().find_one({'_id': video_uuid}, projection={'_id': 1})
         if not video:
             return jsonify({'error': 'Video not found'}), 404
         
         # Record watch event
         watch_record = {
-            'user_id': user_id,
-            'video_id': video_id,
-            'watched_at': datetime.now(timezone.utc),
+            'user_id': user_uuid,
+            'video_id': video_uuid,
+            'watched_at': g.now_utc,
             'progress_seconds': data.get('progress_seconds', 0),
             'duration_seconds': data.get('duration_seconds'),
             'completed': data.get('completed', False),
             'device_info': request.headers.get('User-Agent')
         }
         
-        get_watch_history_collection().insert_one(watch_record)
+        record_watch_event(watch_record)
         
         # Update user's watch stats
         get_user_collection().update_one(
-            {'_id': user_id},
+            {'_id': user_uuid},
             {
                 '$inc': {'total_watch_time': data.get('progress_seconds', 0)},
-                '$set': {'last_watch_at': datetime.now(timezone.utc)}
+                '$set': {'last_watch_at': g.now_utc}
             }
         )
         
@@ -512,40 +959,40 @@ def seed_videos():
         
         sample_videos = [
             {
-                '_id': str(uuid.uuid4()),
+                '_id': uuid.uuid4(),
                 'title': 'How Startups Fail',
                 'description': 'Lessons from real founders about common pitfalls and how to avoid them in your startup journey.',
                 'youtube_id': 'J8M5dPRcNus',
                 'thumbnail_url': 'https://img.youtube.com/vi/J8M5dPRcNus/maxresdefault.jpg',
                 'is_active': True,
-                'created_at': datetime.now(timezone.utc)
+                'created_at': g.now_utc
             },
             {
-                '_id': str(uuid.uuid4()),
+                '_id': uuid.uuid4(),
                 'title': 'The Art of Product Management',
                 'description': 'Learn the essential skills and frameworks used by top product managers at leading tech companies.',
                 'youtube_id': 'huTSPanXdqg',
                 'thumbnail_url': 'https://img.youtube.com/vi/huTSPanXdqg/maxresdefault.jpg',
                 'is_active': True,
-                'created_at': datetime.now(timezone.utc)
+                'created_at': g.now_utc
             },
             {
-                '_id': str(uuid.uuid4()),
+                '_id': uuid.uuid4(),
                 'title': 'Building Scalable Systems',
                 'description': 'Architecture patterns and best practices for building systems that can handle millions of users.',
                 'youtube_id': '9n8hP4dQEEw',
                 'thumbnail_url': 'https://img.youtube.com/vi/9n8hP4dQEEw/maxresdefault.jpg',
                 'is_active': True,
-                'created_at': datetime.now(timezone.utc)
+                'created_at': g.now_utc
             },
             {
-                '_id': str(uuid.uuid4()),
+                '_id': uuid.uuid4(),
                 'title': 'Design Thinking Workshop',
                 'description': 'A hands-on workshop covering the design thinking methodology for solving complex problems.',
                 'youtube_id': '5VCPyrU0qVQ',
                 'thumbnail_url': 'https://img.youtube.com/vi/5VCPyrU0qVQ/maxresdefault.jpg',
                 'is_active': True,
-                'created_at': datetime.now(timezone.utc)
+                'created_at': g.now_utc
             }
         ]
         
@@ -563,6 +1010,7 @@ def seed_videos():
 # ============== HEALTH CHECK ==============
 
 @app.route('/api/health', methods=['GET'])
+@limiter.exempt
 def health_check():
     """Health check endpoint"""
     try:
@@ -575,16 +1023,22 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'database': db_status,
-        'timestamp': datetime.now(timezone.utc).isoformat()
+        'timestamp': g.now_utc.isoformat()
     }), 200
 
 
 # ============== ERROR HANDLERS ==============
 
+@app.errorhandler(RevocationCheckUnavailable)
+def revocation_unavailable_handler(e):
+    """Handle an unreachable token blacklist"""
+    return jsonify({'error': 'Service temporarily unavailable'}), 503, {'Retry-After': '1'}
+
+
 @app.errorhandler(429)
 def ratelimit_handler(e):
     """Handle rate limit exceeded"""
-    logger.warning(f"Rate limit exceeded: {get_remote_address()}")
+    logger.warning(f"Rate limit exceeded: {get_client_address()}")
     return jsonify({
         'error': 'Rate limit exceeded',
         'retry_after': e.description
@@ -605,19 +1059,20 @@ def forbidden_handler(e):
 
 # ============== MAIN ==============
 
-if __name__ == '__main__':
-    # Ensure indexes
+def ensure_indexes():
+    """Create database indexes (idempotent)"""
     try:
         get_user_collection().create_index('email', unique=True)
-        get_token_collection().create_index('jti', unique=True)
-        get_token_collection().create_index(
-            'revoked_at',
-            expireAfterSeconds=7 * 24 * 60 * 60  # Auto-delete after 7 days
-        )
-        get_watch_history_collection().create_index([('user_id', 1), ('watched_at', -1)])
+        get_video_collection().create_index([('is_active', 1), ('_id', 1)])
+        # Acknowledged handle so index errors surface (the accessor uses w=0)
+        mongo.db.watch_history.create_index([('user_id', 1), ('watched_at', -1)])
         logger.info("Database indexes created successfully")
     except Exception as e:
         logger.warning(f"Index creation warning: {e}")
+
+
+if __name__ == '__main__':
+    ensure_indexes()
     
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('FLASK_ENV') == 'development'
@@ -0,0 +1,99 @@
+"""
+One-off migration: string ids -> BSON Binary UUIDs
+===================================================
+Converts `_id` in users and videos, and `user_id`/`video_id` in
+watch_history, from 36-character strings to Binary subtype 4 UUIDs.
+Safe to re-run: collections without string ids are left alone.
+Stop the API while it runs; writes made during the copy would be lost.
+
+Usage:
+    python migrate_uuid_ids.py
+"""
+
+import os
+import uuid
+from dotenv import load_dotenv
+from pymongo import MongoClient
+
+load_dotenv()
+
+
+def _to_uuid(value):
+    try:
+        return uuid.UUID(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def migrate_ids(collection, batch_size: int = 1000) -> int:
+    """Rewrite a collection with UUID _ids via a temp collection and rename
+
+    _id is immutable, and inserting converted copies next to the originals
+    would collide with unique secondary indexes (users.email). Instead the
+    converted documents go into a fresh collection carrying the same
+    indexes, which then atomically replaces the original.
+    """
+    if collection.count_documents({'_id': {'$type': 'string'}}, limit=1) == 0:
+        return 0
+
+    temp = collection.database[f"{collection.name}_uuid_migration"]
+    temp.drop()
+    for name, info in collection.index_information().items():
+        if name == '_id_':
+            continue
+        keys = info.pop('key')
+        info.pop('v', None)
+        info.pop('ns', None)
+        temp.create_index(keys, name=name, **info)
+
+    migrated = 0
+    batch = []
+    for doc in collection.find():
+        if isinstance(doc['_id'], str):
+            new_id = _to_uuid(doc['_id'])
+            if new_id is None:
+                print(f"  keeping {collection.name} {doc['_id']!r}: not a UUID")
+            else:
+                doc['_id'] = new_id
+                migrated += 1
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            temp.insert_many(batch)
+            batch = []
+    if batch:
+        temp.insert_many(batch)
+
+    temp.rename(collection.name, dropTarget=True)
+    return migrated
+
+
+def migrate_references(collection, fields) -> int:
+    """Convert string UUID reference fields in place"""
+    migrated = 0
+    query = {'$or': [{field: {'$type': 'string'}} for field in fields]}
+    for doc in collection.find(query, projection={field: 1 for field in fields}):
+        updates = {}
+        for field in fields:
+            value = _to_uuid(doc.get(field)) if isinstance(doc.get(field), str) else None
+            if value is not None:
+                updates[field] = value
+        if updates:
+            collection.update_one({'_id': doc['_id']}, {'$set': updates})
+            migrated += 1
+    return migrated
+
+
+def main():
+    client = MongoClient(
+        os.getenv('MONGO_URI', 'mongodb://localhost:27017/videoapp'),
+        uuidRepresentation='standard'
+    )
+    db = client.get_default_database()
+
+    print(f"users: {migrate_ids(db.users)} migrated")
+    print(f"videos: {migrate_ids(db.videos)} migrated")
+    print(f"watch_history: {migrate_references(db.watch_history, ['user_id', 'video_id'])} migrated")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,18 @@
+"""
+bcrypt helpers run inside the password-hashing worker processes.
+Kept free of import-time side effects: spawn/forkserver workers import
+this module, never app.py.
+"""
+
+import bcrypt
+
+
+def hash_password(password: str, rounds: int) -> str:
+    """Hash password using bcrypt"""
+    salt = bcrypt.gensalt(rounds=rounds)
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+
+def check_password(password: str, hashed: str) -> bool:
+    """Verify password against hash"""
+    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
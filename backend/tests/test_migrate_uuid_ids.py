@@ -0,0 +1,50 @@
+import uuid
+
+import mongomock
+import pytest
+
+import migrate_uuid_ids
+
+
+@pytest.fixture
+def db(monkeypatch):
+    # mongomock validates documents with the default (UNSPECIFIED) UUID
+    # codec, which rejects native UUIDs; the real client uses 'standard'
+    monkeypatch.setattr(mongomock.collection, 'BSON', None)
+    return mongomock.MongoClient().videoapp
+
+
+def test_migrate_ids_with_unique_email_index(db):
+    db.users.create_index('email', unique=True)
+    ids = [str(uuid.uuid4()) for _ in range(3)]
+    db.users.insert_many([
+        {'_id': user_id, 'email': f"user{i}@example.com", 'name': f"User {i}"}
+        for i, user_id in enumerate(ids)
+    ])
+
+    assert migrate_uuid_ids.migrate_ids(db.users) == 3
+
+    assert db.users.count_documents({}) == 3
+    for user_id in ids:
+        assert db.users.find_one({'_id': uuid.UUID(user_id)})['name'].startswith('User')
+    assert db.users.index_information()['email_1']['unique'] is True
+    assert 'users_uuid_migration' not in db.list_collection_names()
+
+
+def test_migrate_ids_is_idempotent(db):
+    db.videos.insert_one({'_id': str(uuid.uuid4()), 'title': 'Video'})
+
+    assert migrate_uuid_ids.migrate_ids(db.videos) == 1
+    assert migrate_uuid_ids.migrate_ids(db.videos) == 0
+    assert db.videos.count_documents({}) == 1
+
+
+def test_migrate_references(db):
+    user_id, video_id = str(uuid.uuid4()), str(uuid.uuid4())
+    db.watch_history.insert_one({'user_id': user_id, 'video_id': video_id})
+
+    assert migrate_uuid_ids.migrate_references(db.watch_history, ['user_id', 'video_id']) == 1
+
+    record = db.watch_history.find_one()
+    assert record['user_id'] == uuid.UUID(user_id)
+    assert record['video_id'] == uuid.UUID(video_id)
@@ -0,0 +1,17 @@
+"""
+WSGI entry point for production
+================================
+Run with gevent workers so Mongo/Redis I/O from many requests overlaps:
+
+    gunicorn -k gevent -w 4 --worker-connections 1000 wsgi:app
+
+Monkey-patching must happen before pymongo/redis are imported.
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+from app import app, ensure_indexes  # noqa: E402
+
+ensure_indexes()
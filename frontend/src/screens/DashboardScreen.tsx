@@ -13,12 +13,13 @@ const DashboardScreen = () => {
   const [videos, setVideos] = useState<Video[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [isRefreshing, setIsRefreshing] = useState(false);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [pagination, setPagination] = useState<DashboardResponse['pagination'] | null>(null);
 
-  const fetchVideos = useCallback(async (page: number = 1) => {
+  const fetchVideos = useCallback(async (after: string | null = null) => {
     try {
-      const response = await getDashboard(page, 10);
-      setVideos(response.videos);
+      const response = await getDashboard(after, 10);
+      setVideos((current) => (after ? [...current, ...response.videos] : response.videos));
       setPagination(response.pagination);
     } catch (error: any) {
       console.error(error);
@@ -42,6 +43,13 @@ const DashboardScreen = () => {
     setIsRefreshing(false);
   };
 
+  const loadMore = async () => {
+    if (!pagination?.next_cursor) return;
+    setIsLoadingMore(true);
+    await fetchVideos(pagination.next_cursor);
+    setIsLoadingMore(false);
+  };
+
   const handleVideoClick = (video: Video) => {
     navigate(`/video/${video.id}`, {
       state: {
@@ -99,7 +107,12 @@ const DashboardScreen = () => {
 
       {pagination && pagination.total_pages > 1 && (
         <div style={{ marginTop: '3rem', textAlign: 'center', color: 'var(--text-secondary)' }}>
-          Page {pagination.page} of {pagination.total_pages}
+          <p>Showing {videos.length} of {pagination.total}</p>
+          {pagination.next_cursor && (
+            <button className="btn-secondary" onClick={loadMore} disabled={isLoadingMore} style={{ marginTop: '1rem', padding: '0.5rem 1.5rem' }}>
+              {isLoadingMore ? 'Loading...' : 'Load More'}
+            </button>
+          )}
         </div>
       )}
 
@@ -13,10 +13,11 @@ import {
 
 /**
  * Get dashboard videos
+ * Pass the previous page's next_cursor as `after` to fetch the next page
  */
-export const getDashboard = async (page: number = 1, perPage: number = 2): Promise<DashboardResponse> => {
+export const getDashboard = async (after: string | null = null, perPage: number = 2): Promise<DashboardResponse> => {
   const response = await apiClient.axios.get<DashboardResponse>('/dashboard', {
-    params: { page, per_page: perPage },
+    params: after ? { after, per_page: perPage } : { per_page: perPage },
   });
   return response.data;
 };
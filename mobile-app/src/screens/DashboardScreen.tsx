@@ -34,15 +34,16 @@ const DashboardScreen: React.FC<DashboardScreenProps> = ({ navigation }) => {
   const [videos, setVideos] = useState<Video[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [isRefreshing, setIsRefreshing] = useState(false);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [pagination, setPagination] = useState<DashboardResponse['pagination'] | null>(null);
 
   /**
-   * Fetch videos from API
+   * Fetch videos from API; with a cursor the page is appended
    */
-  const fetchVideos = useCallback(async (page: number = 1): Promise<void> => {
+  const fetchVideos = useCallback(async (after: string | null = null): Promise<void> => {
     try {
-      const response = await getDashboard(page, 2);
-      setVideos(response.videos);
+      const response = await getDashboard(after, 2);
+      setVideos((current) => (after ? [...current, ...response.videos] : response.videos));
       setPagination(response.pagination);
     } catch (error: any) {
       const errorMessage = error.response?.data?.error || 'Failed to load videos';
@@ -75,6 +76,18 @@ const DashboardScreen: React.FC<DashboardScreenProps> = ({ navigation }) => {
     setIsRefreshing(false);
   };
 
+  /**
+   * Fetch the next page when the list end is reached
+   */
+  const onEndReached = async (): Promise<void> => {
+    if (isLoadingMore || !pagination?.next_cursor) {
+      return;
+    }
+    setIsLoadingMore(true);
+    await fetchVideos(pagination.next_cursor);
+    setIsLoadingMore(false);
+  };
+
   /**
    * Handle video tile press
    */
@@ -149,6 +162,8 @@ const DashboardScreen: React.FC<DashboardScreenProps> = ({ navigation }) => {
         refreshControl={
           <RefreshControl refreshing={isRefreshing} onRefresh={onRefresh} />
         }
+        onEndReached={onEndReached}
+        onEndReachedThreshold={0.5}
         ListHeaderComponent={
           <Text style={styles.headerText}>Featured Videos</Text>
         }
@@ -156,7 +171,7 @@ const DashboardScreen: React.FC<DashboardScreenProps> = ({ navigation }) => {
           pagination && pagination.total_pages > 1 ? (
             <View style={styles.paginationInfo}>
               <Text style={styles.paginationText}>
-                Page {pagination.page} of {pagination.total_pages}
+                Showing {videos.length} of {pagination.total}
               </Text>
             </View>
           ) : null
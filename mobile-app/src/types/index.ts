@@ -59,10 +59,11 @@ export interface StreamData {
 export interface DashboardResponse {
   videos: Video[];
   pagination: {
-    page: number;
+    page: number | null;
     per_page: number;
     total: number;
     total_pages: number;
+    next_cursor: string | null;
   };
 }
 